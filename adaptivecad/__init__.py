@@ -45,28 +45,37 @@ from .quantum_visualization import (
 )
 
 
+# The wrappers below defer the import of their backing module until first use
+# and then rebind the package attribute to the real function, so later calls
+# through ``adaptivecad.<name>`` skip the wrapper entirely.
+
 def generate_gcode_from_shape(*args, **kwargs):
-    from .gcode_generator import generate_gcode_from_shape
-    return generate_gcode_from_shape(*args, **kwargs)
+    from .gcode_generator import generate_gcode_from_shape as _f
+    globals()["generate_gcode_from_shape"] = _f
+    return _f(*args, **kwargs)
 
 
 def generate_gcode_from_ama_file(*args, **kwargs):
-    from .gcode_generator import generate_gcode_from_ama_file
-    return generate_gcode_from_ama_file(*args, **kwargs)
+    from .gcode_generator import generate_gcode_from_ama_file as _f
+    globals()["generate_gcode_from_ama_file"] = _f
+    return _f(*args, **kwargs)
 
 
 def generate_gcode_from_ama_data(*args, **kwargs):
-    from .gcode_generator import generate_gcode_from_ama_data
-    return generate_gcode_from_ama_data(*args, **kwargs)
+    from .gcode_generator import generate_gcode_from_ama_data as _f
+    globals()["generate_gcode_from_ama_data"] = _f
+    return _f(*args, **kwargs)
 
 
 def load_stl(*args, **kwargs):
     """Convenience wrapper for :func:`simple_stl.load_stl`."""
-    from .simple_stl import load_stl as _load_stl
-    return _load_stl(*args, **kwargs)
+    from .simple_stl import load_stl as _f
+    globals()["load_stl"] = _f
+    return _f(*args, **kwargs)
 
 
 def export_slices_from_ama(*args, **kwargs):
     """Convenience wrapper for :func:`slice_export.export_slices_from_ama`."""
-    from .slice_export import export_slices_from_ama as _export
-    return _export(*args, **kwargs)
\ No newline at end of file
+    from .slice_export import export_slices_from_ama as _f
+    globals()["export_slices_from_ama"] = _f
+    return _f(*args, **kwargs)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import sympy as sp
 from dataclasses import dataclass
 from typing import Any, Dict, List
@@ -19,13 +21,31 @@ def _num(val: Any) -> float:
     raise TypeError(f"Expected numeric value, got {val!r}")
 
 
+@functools.lru_cache(maxsize=256)
+def _sympify_cached(expr: str) -> sp.Expr:
+    """Parse ``expr`` once; repeated AI specs often reuse the same equation."""
+    return sp.sympify(expr)
+
+
 class ImplicitSurface:
     """Minimal implicit surface placeholder."""
 
     def __init__(self, expression: str | sp.Expr, domain: Dict[str, List[float]], iso_level: float = 0.0) -> None:
-        self.expression = sp.sympify(expression)
+        if isinstance(expression, str):
+            self.expression = _sympify_cached(expression)
+        else:
+            self.expression = sp.sympify(expression)
         self.domain = domain
         self.iso_level = iso_level
+        self.symbols = tuple(sorted(self.expression.free_symbols, key=str))
+        self._f = sp.lambdify(self.symbols, self.expression, modules="numpy")
+
+    def evaluate(self, *coords: Any) -> Any:
+        """Evaluate the expression on scalars or NumPy grids.
+
+        Arguments are matched to :attr:`symbols`, which are sorted by name.
+        """
+        return self._f(*coords)
 
     def is_manifold(self) -> bool:  # pragma: no cover - placeholder
         return True
@@ -3,6 +3,12 @@ from __future__ import annotations
 
 from typing import Any
 
+try:  # Optional OCC dependency, resolved once rather than per layer
+    from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section  # type: ignore
+    from OCC.Core.gp import gp_Pln, gp_Ax3, gp_Dir, gp_Pnt  # type: ignore
+except Exception:  # pragma: no cover - optional dependency missing
+    BRepAlgoAPI_Section = None  # type: ignore
+
 
 def slice_brep_for_layer(shape: Any, z: float):
     """Return the intersection of ``shape`` with a horizontal plane.
@@ -24,11 +30,8 @@ def slice_brep_for_layer(shape: Any, z: float):
     This function requires ``pythonocc-core``. If the package is not
     installed, :class:`ImportError` is raised when the function is called.
     """
-    try:
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-        from OCC.Core.gp import gp_Pln, gp_Ax3, gp_Dir, gp_Pnt
-    except Exception as exc:  # pragma: no cover - optional dependency
-        raise ImportError("pythonocc-core is required for analytic slicing") from exc
+    if BRepAlgoAPI_Section is None:
+        raise ImportError("pythonocc-core is required for analytic slicing")
 
     plane = gp_Pln(gp_Ax3(gp_Pnt(0, 0, z), gp_Dir(0, 0, 1)))
     section = BRepAlgoAPI_Section(shape, plane)
@@ -1,11 +1,36 @@
 """CAM module stubs for AdaptiveCAD."""
 
+from typing import Iterator
+
+import numpy as np
+
 from ..linalg import Vec3
 
 
-def linear_toolpath(points):
-    """Generate a simple linear toolpath from a list of points."""
-    return [Vec3(p.x, p.y, p.z) for p in points]
+def linear_toolpath(points) -> np.ndarray:
+    """Generate a simple linear toolpath from a list of points.
+
+    ``points`` may be an ``(N, 3)`` array, which is passed through without
+    copying when it is already ``float32``, or a sequence of objects with
+    ``x``, ``y`` and ``z`` attributes such as :class:`Vec3`.
+
+    Returns:
+        numpy.ndarray: ``(N, 3)`` ``float32`` array of toolpath points.
+    """
+    if isinstance(points, np.ndarray):
+        arr = np.asarray(points, dtype=np.float32)
+        return arr if arr.ndim == 2 else arr.reshape(-1, 3)
+    n = len(points)
+    flat = np.fromiter(
+        (c for p in points for c in (p.x, p.y, p.z)), dtype=np.float32, count=3 * n
+    )
+    return flat.reshape(n, 3)
+
+
+def iter_vec3(path: np.ndarray) -> Iterator[Vec3]:
+    """Yield the rows of a toolpath array as :class:`Vec3` objects."""
+    for x, y, z in path.tolist():
+        yield Vec3(x, y, z)
 
 
 def adaptive_clearing_5axis(shape, tool_radius: float = 3.0):
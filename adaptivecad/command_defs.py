@@ -9,6 +9,7 @@ package can be used without installing ``pythonocc-core`` or ``PyQt``.
 """
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any, Dict, List
 
 from adaptivecad.params import ParamEnv
@@ -250,6 +251,33 @@ class Feature:
 DOCUMENT: List[Feature] = []
 
 
+_get_shape = attrgetter("shape")
+
+
+def document_compound(features=None):
+    """Return a ``TopoDS_Compound`` holding every shape in ``features``.
+
+    ``features`` defaults to :data:`DOCUMENT`.  Features whose shape is
+    ``None`` are skipped; ``None`` is returned when nothing is left to add.
+    """
+    if features is None:
+        features = DOCUMENT
+    shapes = [s for s in map(_get_shape, features) if s is not None]
+    if not shapes:
+        return None
+
+    from OCC.Core.BRep import BRep_Builder
+    from OCC.Core.TopoDS import TopoDS_Compound
+
+    builder = BRep_Builder()
+    compound = TopoDS_Compound()
+    builder.MakeCompound(compound)
+    add = builder.Add
+    for shape in shapes:
+        add(compound, shape)
+    return compound
+
+
 def rebuild_scene(display) -> None:
     """Re-display only active shapes in the document (hide consumed ones)."""
     from adaptivecad.display_utils import smoother_display
@@ -1,6 +1,7 @@
 import os
 import concurrent.futures
 import threading
+import time
 import warnings
 from PySide6.QtWidgets import QFileDialog, QInputDialog, QMessageBox
 from PySide6.QtCore import QThread, Signal
@@ -25,6 +26,9 @@ from ..geom.hyperbolic import pi_a_over_pi, validate_hyperbolic_params
 from ..nd_math import stable_pi_a_over_pi
 import math
 
+# Minimum time between PROGRESS signals; each emit is a queued cross-thread call.
+PROGRESS_EMIT_INTERVAL = 0.05
+
 
 def smooth_input(x, y, z, poles, i, j, nb_u_poles, nb_v_poles):
     """Return averaged coordinates using neighboring control points."""
@@ -150,12 +154,16 @@ class ImportThread(QThread):
                         for idx, face_data in enumerate(bspline_faces)
                     }
                     completed = 0
+                    last_emit = time.monotonic()
                     for future in as_completed(future_to_idx):
                         result = future.result()
                         results.append(result)
                         completed += 1
                         print(f"[ImportThread] Completed surface {completed}/{total}")
-                        self.progress_update.emit(f"PROGRESS:{completed}/{total}")
+                        now = time.monotonic()
+                        if completed == total or now - last_emit >= PROGRESS_EMIT_INTERVAL:
+                            last_emit = now
+                            self.progress_update.emit(f"PROGRESS:{completed}/{total}")
                         
                 successful_results = [r for r in results if r['success']]
                 print(f"[ImportThread] Processing complete: {len(successful_results)}/{total} surfaces successful")
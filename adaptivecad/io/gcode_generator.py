@@ -1,5 +1,5 @@
 import math
-from typing import List, Dict, Tuple, Union, Optional
+from typing import List, Dict, Iterator, Tuple, Union, Optional
 import os
 
 class Point3D:
@@ -196,10 +196,23 @@ class GCodeProgram:
         """Generate complete G-code program as a string."""
         return '\n'.join(cmd.to_string() for cmd in self.commands)
     
+    def iter_bytes(self, chunk_lines: int = 1024) -> Iterator[bytes]:
+        """Yield the program as encoded blocks of ``chunk_lines`` lines.
+
+        Joining the blocks gives the same text as :meth:`to_string`, without
+        ever holding the whole program as one string.
+        """
+        commands = self.commands
+        for start in range(0, len(commands), chunk_lines):
+            block = '\n'.join(cmd.to_string() for cmd in commands[start:start + chunk_lines])
+            if start:
+                block = '\n' + block
+            yield block.encode('utf-8')
+
     def save(self, filepath: str):
         """Save G-code program to file."""
-        with open(filepath, 'w') as f:
-            f.write(self.to_string())
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            f.writelines(self.iter_bytes())
         print(f"G-code program saved to {filepath}")
 
 def import_time():
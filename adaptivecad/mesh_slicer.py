@@ -0,0 +1,183 @@
+"""Triangle-mesh slicing helpers.
+
+Counterpart to :mod:`adaptivecad.analytic_slicer` for tessellated input such
+as the vertex/face arrays returned by :func:`adaptivecad.simple_stl.load_stl`.
+The mesh is stored as three structure-of-arrays corner buffers ``(V0, V1, V2)``
+so every layer is cut with a handful of whole-array NumPy operations instead
+of a Python loop over triangles.  When ``numba`` is installed the per-layer
+scan runs in a parallel JIT kernel.
+"""
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+try:  # Optional JIT backend
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional dependency missing
+    njit = None
+
+__all__ = ["mesh_to_soa", "slice_triangles", "iter_slices", "slice_mesh"]
+
+# Triangle edges as (start corner, end corner) pairs.
+_EDGE_A = np.array([0, 1, 2])
+_EDGE_B = np.array([1, 2, 0])
+
+
+def mesh_to_soa(verts: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return per-corner vertex arrays for an indexed triangle mesh.
+
+    Parameters
+    ----------
+    verts:
+        ``(N, 3)`` array of vertex positions.
+    faces:
+        ``(M, 3)`` array of vertex indices.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        ``(V0, V1, V2)``, each a C-contiguous ``(M, 3)`` ``float32`` array.
+    """
+    verts = np.asarray(verts, dtype=np.float32)
+    faces = np.asarray(faces, dtype=np.intp)
+    return tuple(np.ascontiguousarray(verts[faces[:, k]]) for k in range(3))
+
+
+def slice_triangles(V0: np.ndarray, V1: np.ndarray, V2: np.ndarray, z: float) -> np.ndarray:
+    """Intersect triangles with the horizontal plane at height ``z``.
+
+    Corners lying exactly on the plane are treated as above it, so every
+    triangle is crossed by either zero or two of its edges.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(K, 2, 3)`` array of segment end points, one row per cut triangle.
+    """
+    tri = np.stack((V0, V1, V2), axis=1)  # (M, 3 corners, 3 coords)
+    below = tri[:, :, 2] < z
+    crossing = below[:, _EDGE_A] != below[:, _EDGE_B]
+    hit = crossing.any(axis=1)
+    if not hit.any():
+        return np.empty((0, 2, 3), dtype=tri.dtype)
+
+    tri = tri[hit]
+    crossing = crossing[hit]
+    pa = tri[:, _EDGE_A]
+    pb = tri[:, _EDGE_B]
+    sa = pa[:, :, 2] - z
+    sb = pb[:, :, 2] - z
+    denom = np.where(crossing, sa - sb, 1.0)
+    t = sa / denom
+    pts = pa + t[:, :, None] * (pb - pa)
+    return pts[crossing].reshape(-1, 2, 3)
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _slice_layer_kernel(V0, V1, V2, z, out_pts, out_mask):
+        """Write the cut segment of triangle ``i`` to ``out_pts[i]``."""
+        for i in prange(V0.shape[0]):
+            k = 0
+            for e in range(3):
+                if e == 0:
+                    pa = V0[i]
+                    pb = V1[i]
+                elif e == 1:
+                    pa = V1[i]
+                    pb = V2[i]
+                else:
+                    pa = V2[i]
+                    pb = V0[i]
+                sa = pa[2] - z
+                sb = pb[2] - z
+                if (sa < 0.0) != (sb < 0.0):
+                    t = sa / (sa - sb)
+                    for c in range(3):
+                        out_pts[i, k, c] = pa[c] + t * (pb[c] - pa[c])
+                    k += 1
+            out_mask[i] = k == 2
+
+else:  # pragma: no cover - optional dependency missing
+    _slice_layer_kernel = None
+
+
+def iter_slices(verts: np.ndarray, faces: np.ndarray, z_values: Iterable[float]) -> Iterator[np.ndarray]:
+    """Yield the ``(K, 2, 3)`` segment array of each layer in ``z_values``.
+
+    With the JIT kernel every layer is compacted into one scratch buffer
+    allocated up front, and the yielded array is a view into it.  The view is
+    overwritten when the next layer is produced, so copy any layer that has to
+    outlive the iteration.
+    """
+    V0, V1, V2 = mesh_to_soa(verts, faces)
+    if _slice_layer_kernel is None:
+        for z in z_values:
+            yield slice_triangles(V0, V1, V2, float(z))
+        return
+
+    # Scratch buffers are allocated once and reused for every layer.
+    m = V0.shape[0]
+    out_pts = np.empty((m, 2, 3), dtype=np.float32)
+    out_mask = np.empty(m, dtype=np.bool_)
+    seg_buf = np.empty_like(out_pts)
+    for z in z_values:
+        _slice_layer_kernel(V0, V1, V2, np.float32(z), out_pts, out_mask)
+        segments = seg_buf[: np.count_nonzero(out_mask)]
+        np.compress(out_mask, out_pts, axis=0, out=segments)
+        yield segments
+
+
+def slice_mesh(
+    verts: np.ndarray,
+    faces: np.ndarray,
+    z_values: Iterable[float],
+    max_workers: Optional[int] = None,
+) -> List[np.ndarray]:
+    """Slice an indexed triangle mesh at each height in ``z_values``.
+
+    Parameters
+    ----------
+    verts, faces:
+        Indexed triangle mesh as accepted by :func:`mesh_to_soa`.
+    z_values:
+        Layer heights.
+    max_workers:
+        When greater than one, split ``z_values`` into that many contiguous
+        slabs and slice them in separate processes.  Layers are returned in
+        the order of ``z_values`` either way.
+
+    Returns
+    -------
+    list[numpy.ndarray]
+        One ``(K, 2, 3)`` segment array per requested layer.
+    """
+    if max_workers is not None and max_workers > 1:
+        return _slice_mesh_parallel(verts, faces, z_values, max_workers)
+
+    layers = iter_slices(verts, faces, z_values)
+    if _slice_layer_kernel is None:
+        return list(layers)
+    return [segments.copy() for segments in layers]
+
+
+def _slice_mesh_parallel(verts, faces, z_values, max_workers: int) -> List[np.ndarray]:
+    """Slice Z slabs in worker processes and concatenate them in order.
+
+    Workers are spawned rather than forked: forking after the parallel numba
+    kernel has started its threading layer deadlocks the children.
+    """
+    verts = np.asarray(verts, dtype=np.float32)
+    faces = np.asarray(faces, dtype=np.intp)
+    slabs = [s for s in np.array_split(np.asarray(list(z_values), dtype=float), max_workers) if s.size]
+    if len(slabs) <= 1:
+        return slice_mesh(verts, faces, slabs[0] if slabs else [])
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(slabs), mp_context=ctx) as pool:
+        futures = [pool.submit(slice_mesh, verts, faces, slab) for slab in slabs]
+        return [layer for future in futures for layer in future.result()]
@@ -9,6 +9,14 @@ from typing import Iterable
 from .io.ama_reader import read_ama
 from .analytic_slicer import slice_brep_for_layer
 
+try:  # Optional OCC dependency
+    from OCC.Core.BRep import BRep_Builder  # type: ignore
+    from OCC.Core.BRepTools import breptools_Read, breptools_Write  # type: ignore
+    from OCC.Core.StlAPI import StlAPI_Writer  # type: ignore
+    from OCC.Core.TopoDS import TopoDS_Shape  # type: ignore
+except Exception:  # pragma: no cover - optional dependency missing
+    BRep_Builder = None  # type: ignore
+
 __all__ = ["export_slices_from_ama"]
 
 
@@ -36,13 +44,8 @@ def export_slices_from_ama(ama_path: str | os.PathLike, z_values: Iterable[float
     This function requires ``pythonocc-core`` for B-rep operations. If the
     dependency is missing, :class:`ImportError` will be raised.
     """
-    try:
-        from OCC.Core.BRep import BRep_Builder
-        from OCC.Core.BRepTools import breptools_Read, breptools_Write
-        from OCC.Core.StlAPI import StlAPI_Writer
-        from OCC.Core.TopoDS import TopoDS_Shape
-    except Exception as exc:  # pragma: no cover - optional dependency
-        raise ImportError("pythonocc-core is required for slicing export") from exc
+    if BRep_Builder is None:
+        raise ImportError("pythonocc-core is required for slicing export")
 
     ama = read_ama(str(ama_path))
     if not ama or not ama.parts:
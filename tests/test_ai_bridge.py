@@ -25,3 +25,14 @@ def test_sine_surface_roundtrip(monkeypatch):
     spec = openai_bridge.call_openai("dummy")
     geom = translator.build_geometry(spec)
     assert geom.is_manifold()
+
+
+def test_implicit_surface_evaluate_grid():
+    import numpy as np
+    from adaptivecad.ai.translator import ImplicitSurface
+
+    surf = ImplicitSurface("x**2 + y**2 - 1", {})
+    again = ImplicitSurface("x**2 + y**2 - 1", {})
+    assert again.expression is surf.expression
+    xs = np.array([0.0, 1.0, 2.0])
+    np.testing.assert_allclose(surf.evaluate(xs, 0.0), [-1.0, 0.0, 3.0])
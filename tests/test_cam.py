@@ -4,3 +4,15 @@ from adaptivecad.cam import adaptive_clearing_5axis
 def test_adaptive_clearing_not_implemented():
     with pytest.raises(NotImplementedError):
         adaptive_clearing_5axis(None)
+
+
+def test_linear_toolpath_array():
+    import numpy as np
+    from adaptivecad.cam import linear_toolpath, iter_vec3
+    from adaptivecad.linalg import Vec3
+
+    path = linear_toolpath([Vec3(0.0, 0.0, 0.0), Vec3(1.0, 2.0, 3.0)])
+    assert path.shape == (2, 3)
+    assert path.dtype == np.float32
+    assert linear_toolpath(path) is path
+    assert list(iter_vec3(path))[1] == Vec3(1.0, 2.0, 3.0)
@@ -28,3 +28,11 @@ def test_commands_missing_deps(monkeypatch):
     mod = importlib.import_module("adaptivecad.commands")
     with pytest.raises(RuntimeError):
         mod._require_command_modules()
+
+
+def test_document_compound_skips_shapeless_features():
+    from adaptivecad.command_defs import Feature, document_compound
+
+    feats = [Feature("Empty", {}, None), Feature("Other", {}, None)]
+    assert document_compound(feats) is None
+    assert document_compound([]) is None
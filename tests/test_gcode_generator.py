@@ -94,5 +94,11 @@ class TestGCodeGenerator(unittest.TestCase):
             gcode = f.read()
         self.assertIn("Waterline milling operation", gcode)
 
+    def test_program_iter_bytes_matches_to_string(self):
+        """Chunked byte output joins back to the full program text."""
+        program = WaterlineMilling(step_down=0.5, total_depth=3.0).generate({"name": "p"})
+        streamed = b"".join(program.iter_bytes(chunk_lines=3)).decode("utf-8")
+        self.assertEqual(streamed, program.to_string())
+
 if __name__ == '__main__':
     unittest.main(argv=['first-arg-is-ignored'], exit=False)
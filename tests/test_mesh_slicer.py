@@ -0,0 +1,60 @@
+import os
+
+import numpy as np
+
+from adaptivecad.simple_stl import load_stl
+from adaptivecad.mesh_slicer import slice_mesh
+
+
+def _cube():
+    path = os.path.join(os.path.dirname(__file__), "..", "test_cube.stl")
+    return load_stl(path)
+
+
+def test_slice_cube_mid_height():
+    verts, faces = _cube()
+    (segments,) = slice_mesh(verts, faces, [0.5])
+    # two triangles per side face are cut
+    assert segments.shape == (8, 2, 3)
+    assert np.allclose(segments[:, :, 2], 0.5)
+    lengths = np.linalg.norm(segments[:, 1] - segments[:, 0], axis=1)
+    assert np.isclose(lengths.sum(), 4.0, atol=1e-5)
+
+
+def test_slice_outside_mesh_is_empty():
+    verts, faces = _cube()
+    below, above = slice_mesh(verts, faces, [-1.0, 2.0])
+    assert below.shape == (0, 2, 3)
+    assert above.shape == (0, 2, 3)
+
+
+def test_numpy_fallback_matches(monkeypatch):
+    from adaptivecad import mesh_slicer
+
+    verts, faces = _cube()
+    z_values = [0.25, 0.5, 0.75]
+    fast = slice_mesh(verts, faces, z_values)
+    monkeypatch.setattr(mesh_slicer, "_slice_layer_kernel", None)
+    slow = slice_mesh(verts, faces, z_values)
+    for a, b in zip(fast, slow):
+        assert np.allclose(a, b)
+
+
+def test_iter_slices_matches_slice_mesh():
+    from adaptivecad.mesh_slicer import iter_slices
+
+    verts, faces = _cube()
+    z_values = [0.25, 0.5, 0.75]
+    expected = slice_mesh(verts, faces, z_values)
+    for got, want in zip(iter_slices(verts, faces, z_values), expected):
+        assert np.allclose(got, want)
+
+
+def test_process_pool_matches_serial():
+    verts, faces = _cube()
+    z_values = [0.1, 0.3, 0.5, 0.7, 0.9]
+    serial = slice_mesh(verts, faces, z_values)
+    parallel = slice_mesh(verts, faces, z_values, max_workers=2)
+    assert len(parallel) == len(serial)
+    for a, b in zip(parallel, serial):
+        assert np.allclose(a, b)
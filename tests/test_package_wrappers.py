@@ -0,0 +1,11 @@
+import os
+
+import adaptivecad
+from adaptivecad import simple_stl
+
+
+def test_load_stl_wrapper_rebinds():
+    path = os.path.join(os.path.dirname(__file__), "..", "test_cube.stl")
+    verts, faces = adaptivecad.load_stl(path)
+    assert len(verts) == 8
+    assert adaptivecad.load_stl is simple_stl.load_stl